@@ -1,18 +1,28 @@
 from __future__ import annotations
 
 import os
+import queue
+import re
 import sqlite3
-from dataclasses import asdict, dataclass, field
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
 
-from flask import Flask, abort, jsonify, request
+from flask import Flask, Response, abort, current_app, jsonify, request
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - falls back to Flask's JSON provider
+    orjson = None
 
 try:
     from .text_to_sql import generate_sql_from_question, is_openai_available, is_sql_safe
 except ImportError:  # pragma: no cover - allows running app.py directly
     from text_to_sql import generate_sql_from_question, is_openai_available, is_sql_safe
-from flask_cors import CORS
 
 TABLE_NAME = "jeux"
 
@@ -31,8 +41,58 @@ COLUMN_MAP = {
     "everyone_can_play": "tout_le_monde_peut_jouer",
 }
 
+# Precomputed views of COLUMN_MAP so per-row conversions don't re-walk the dict.
+_FIELDS = tuple(COLUMN_MAP.keys())
+_DB_COLS = tuple(COLUMN_MAP.values())
+_PAIRS = tuple(COLUMN_MAP.items())
+_COLUMN_KEYS = frozenset(COLUMN_MAP)
+_EMPTY_DEFAULTS: dict[str, Any] = dict.fromkeys(COLUMN_MAP)
+
+# Matches only the leading keyword, without lowercasing a copy of the whole query.
+# The word boundary keeps identifiers such as "selection" from passing.
+_SELECT_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+
+# SQL text is built once so sqlite3's per-connection statement cache (sized by
+# cached_statements in _open_connection) keeps hitting. That cache is keyed by
+# the exact SQL string, so these must stay constants rather than be rebuilt
+# with request data; values always go through bound parameters.
+# Our own reads list the columns in BoardGame field order so rows can be
+# passed positionally to the constructor.
+_SELECT_COLUMNS = ", ".join(_DB_COLS)
+_SQL_SELECT_ALL = f"SELECT {_SELECT_COLUMNS} FROM {TABLE_NAME} ORDER BY nom_du_jeu COLLATE NOCASE"
+_SQL_SELECT_BY_NAME = f"SELECT {_SELECT_COLUMNS} FROM {TABLE_NAME} WHERE nom_du_jeu = ?"
+_SQL_INSERT = (
+    f"INSERT INTO {TABLE_NAME} ({', '.join(_DB_COLS)}) "
+    f"VALUES ({', '.join(f':{column}' for column in _DB_COLS)}) "
+    f"RETURNING {_SELECT_COLUMNS}"
+)
+_SQL_UPDATE = (
+    f"UPDATE {TABLE_NAME} SET {', '.join(f'{column} = :{column}' for column in _DB_COLS)} "
+    f"WHERE nom_du_jeu = :original_name RETURNING {_SELECT_COLUMNS}"
+)
+_SQL_DELETE = f"DELETE FROM {TABLE_NAME} WHERE nom_du_jeu = ? RETURNING 1"
+
+# CORS headers are fixed (any origin, no credentials), so they are built once
+# instead of being recomputed per response. Preflight answers may be cached by
+# browsers for a day.
+_CORS_HEADERS = {"Access-Control-Allow-Origin": "*"}
+_CORS_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Methods": "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+    "Access-Control-Max-Age": "86400",
+}
+
+# Indexes for the default ordering and the numeric range filters that generated
+# SQL relies on. Text columns are only ever matched with LIKE '%...%', which
+# cannot use an index, so they are left out.
+_SQL_CREATE_INDEXES = f"""
+CREATE INDEX IF NOT EXISTS idx_jeux_nom_nocase ON {TABLE_NAME}(nom_du_jeu COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jeux_joueurs ON {TABLE_NAME}(joueurs_min, joueurs_max);
+CREATE INDEX IF NOT EXISTS idx_jeux_duree ON {TABLE_NAME}(duree_min_minutes, duree_max_minutes);
+PRAGMA optimize;
+"""
 
-@dataclass
+
+@dataclass(slots=True)
 class BoardGame:
     """Typed representation of a board game record."""
 
@@ -49,39 +109,56 @@ class BoardGame:
     everyone_can_play: str = field(default="oui")
 
     @classmethod
-    def from_row(cls, row: sqlite3.Row) -> "BoardGame":
-        data = {
-            field_name: row[COLUMN_MAP[field_name]]
-            for field_name in COLUMN_MAP
-        }
-        return cls(**data)
+    def from_row(cls, row: Sequence[Any]) -> "BoardGame":
+        # Rows come from _SELECT_COLUMNS, i.e. in the same order as the fields.
+        return cls(*row)
 
     def to_db_params(self) -> dict[str, Any]:
+        return {column: getattr(self, field_name) for field_name, column in _PAIRS}
+
+    def to_dict(self) -> dict[str, Any]:
+        # Every field is a str/int/None, so asdict's deep copy is unnecessary; the
+        # literal compiles to direct slot reads and a single dict build.
         return {
-            COLUMN_MAP[field_name]: getattr(self, field_name)
-            for field_name in COLUMN_MAP
+            "name": self.name,
+            "play_time": self.play_time,
+            "min_duration_minutes": self.min_duration_minutes,
+            "max_duration_minutes": self.max_duration_minutes,
+            "player_count": self.player_count,
+            "min_players": self.min_players,
+            "max_players": self.max_players,
+            "team_play": self.team_play,
+            "special_support": self.special_support,
+            "game_type": self.game_type,
+            "everyone_can_play": self.everyone_can_play,
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+
+def _column_getter(description: Any) -> Callable[[Sequence[Any]], tuple[Any, ...]]:
+    """Return an itemgetter pulling the COLUMN_MAP columns, in order, out of a result row."""
+
+    index = {column[0]: position for position, column in enumerate(description)}
+    return itemgetter(*(index[column] for column in _DB_COLS))
+
+
+def _rows_to_dicts(
+    rows: Iterable[Sequence[Any]], getter: Callable[[Sequence[Any]], tuple[Any, ...]]
+) -> list[dict[str, Any]]:
+    """Convert rows straight to API dicts, skipping the BoardGame round trip."""
+
+    return [dict(zip(_FIELDS, values)) for values in map(getter, rows)]
 
 
 def _validate_payload(payload: Mapping[str, Any], *, existing: Optional[BoardGame] = None) -> BoardGame:
     """Validate and merge incoming data into a BoardGame instance."""
 
-    unknown_keys = set(payload) - set(COLUMN_MAP)
+    unknown_keys = payload.keys() - _COLUMN_KEYS
     if unknown_keys:
         abort(400, description=f"Unknown fields: {', '.join(sorted(unknown_keys))}")
 
-    base_data: dict[str, Any]
-    if existing is None:
-        base_data = {field_name: None for field_name in COLUMN_MAP}
-    else:
-        base_data = existing.to_dict()
-
-    for field_name in COLUMN_MAP:
-        if field_name in payload:
-            base_data[field_name] = payload[field_name]
+    base_data = _EMPTY_DEFAULTS.copy() if existing is None else existing.to_dict()
+    # Unknown keys were rejected above, so the payload can be merged wholesale.
+    base_data.update(payload)
 
     name = base_data.get("name")
     if not isinstance(name, str) or not name.strip():
@@ -93,14 +170,217 @@ def _validate_payload(payload: Mapping[str, Any], *, existing: Optional[BoardGam
     return BoardGame(**base_data)
 
 
-def _connect(db_path: Path) -> sqlite3.Connection:
-    connection = sqlite3.connect(db_path)
-    connection.row_factory = sqlite3.Row
+def _json_response(data: Any, status: int = 200) -> Response:
+    """Serialize ``data`` with orjson when available, otherwise with ``jsonify``.
+
+    Both encoders understand dataclasses, so BoardGame instances can be passed
+    as-is without an intermediate ``to_dict`` copy.
+    """
+
+    if orjson is None:
+        response = jsonify(data)
+        response.status_code = status
+        return response
+    return current_app.response_class(orjson.dumps(data), status=status, mimetype="application/json")
+
+
+# Rows per streamed chunk: one encoder call and one WSGI write per batch rather
+# than per row, while the encoded body is still never held in full.
+_STREAM_BATCH_SIZE = 256
+
+
+def _encode_json_array(items: Sequence[Any], encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+    yield b"["
+    for start in range(0, len(items), _STREAM_BATCH_SIZE):
+        if start:
+            yield b","
+        # Encode the slice as an array and drop its brackets to splice it in.
+        yield encode(items[start:start + _STREAM_BATCH_SIZE])[1:-1]
+    yield b"]"
+
+
+def _json_array_response(items: Sequence[Any]) -> Response:
+    """Stream ``items`` as a JSON array, encoding ``_STREAM_BATCH_SIZE`` elements at a time."""
+
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        provider = current_app.json
+
+        def encode(item: Any) -> bytes:
+            return provider.dumps(item).encode("utf-8")
+
+    return current_app.response_class(_encode_json_array(items, encode), mimetype="application/json")
+
+
+# Idle connections kept per database file; extra ones opened under a burst of
+# concurrent requests are closed when they come back.
+_POOL_SIZE = 8
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    # Pooled connections move between request threads, one thread at a time.
+    connection = sqlite3.connect(
+        db_path, isolation_level=None, cached_statements=256, check_same_thread=False
+    )
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    connection.execute("PRAGMA cache_size=-20000")
+    connection.execute("PRAGMA mmap_size=268435456")
     return connection
 
 
+def _prepare_database(app: Flask, connection: sqlite3.Connection) -> None:
+    """Switch the file to WAL and ensure its indexes, if the file can be written.
+
+    WAL lets one connection read while another one writes; like the indexes it
+    is stored in the database file, so it only needs setting once. Both are an
+    optimization (prepare_games_db.py already builds the indexes), so a
+    read-only database is served as it is.
+    """
+
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SQL_CREATE_INDEXES)
+    except sqlite3.OperationalError as exc:
+        app.logger.warning("Skipping WAL/index setup for this database: %s", exc)
+
+
+@contextmanager
+def _connection(app: Flask, db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Check a connection to ``db_path`` out of the app's pool for the enclosed block.
+
+    The pool is not tied to threads: the development server starts a thread
+    per request, so per-thread connections would be opened on every request.
+    Concurrent requests each get their own connection, and idle ones are
+    reused by whichever thread comes next. Database-level setup runs once per
+    file for the app.
+    """
+
+    state = app.extensions["sqlite"]
+    idle = state["pools"].get(db_path)
+    if idle is None:
+        with state["lock"]:
+            idle = state["pools"].setdefault(db_path, queue.LifoQueue(_POOL_SIZE))
+    try:
+        connection = idle.get_nowait()
+    except queue.Empty:
+        connection = _open_connection(db_path)
+        with state["lock"]:
+            if db_path not in state["prepared"]:
+                try:
+                    _prepare_database(app, connection)
+                except sqlite3.DatabaseError:
+                    connection.close()
+                    raise
+                state["prepared"].add(db_path)
+    try:
+        yield connection
+    finally:
+        if connection.in_transaction:
+            connection.rollback()
+        try:
+            idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+class _ResultCache:
+    """Small LRU of read results per database file, revalidated with ``PRAGMA data_version``.
+
+    Each file gets a read-only watcher connection whose ``data_version`` changes
+    whenever any other connection commits, whether it belongs to this app, to
+    another worker process or to prepare_games_db.py. Entries are only served
+    for the version they were read at, and a new version empties that file's
+    entries. Only the app's own fixed queries are cached, never caller SQL.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._watchers: dict[Path, sqlite3.Connection] = {}
+        self._files: dict[Path, tuple[int, OrderedDict[Any, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def version(self, db_path: Path) -> Optional[int]:
+        """Return the current data version of ``db_path``, or ``None`` if it cannot be watched."""
+
+        with self._lock:
+            watcher = self._watchers.get(db_path)
+            try:
+                if watcher is None:
+                    watcher = sqlite3.connect(
+                        f"{db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+                    )
+                    self._watchers[db_path] = watcher
+                (version,) = watcher.execute("PRAGMA data_version").fetchone()
+            except sqlite3.Error:
+                return None
+            current = self._files.get(db_path)
+            if current is None or current[0] != version:
+                self._files[db_path] = (version, OrderedDict())
+            return version
+
+    def _entries(self, db_path: Path, version: Optional[int]) -> Optional[OrderedDict[Any, Any]]:
+        current = self._files.get(db_path)
+        if version is None or current is None or current[0] != version:
+            return None
+        return current[1]
+
+    def get(self, db_path: Path, version: Optional[int], key: Any) -> Any:
+        with self._lock:
+            entries = self._entries(db_path, version)
+            if entries is None:
+                return None
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+            return value
+
+    def put(self, db_path: Path, version: Optional[int], key: Any, value: Any) -> None:
+        with self._lock:
+            # Dropped if the file changed since ``version`` was read.
+            entries = self._entries(db_path, version)
+            if entries is None:
+                return
+            entries[key] = value
+            entries.move_to_end(key)
+            if len(entries) > self._maxsize:
+                entries.popitem(last=False)
+
+    def invalidate(self, db_path: Path) -> None:
+        with self._lock:
+            self._files.pop(db_path, None)
+
+
+@contextmanager
+def _write(app: Flask, db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Yield a pooled connection for a single, autocommitted write statement.
+
+    Connections run with ``isolation_level=None``, so a lone INSERT/DELETE is
+    already atomic and needs no BEGIN/COMMIT round trip of its own.
+    """
+
+    with _connection(app, db_path) as connection:
+        yield connection
+    app.extensions["result_cache"].invalidate(db_path)
+
+
+@contextmanager
+def _transaction(app: Flask, db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements in one explicit transaction on a pooled connection."""
+
+    with _write(app, db_path) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+
 def _get_db_path(app: Flask) -> Path:
-    return Path(app.config["GAMES_DB_PATH"])
+    return app.config["GAMES_DB_PATH_OBJ"]
 
 
 def _resolve_db_path(app: Flask, requested_db: Optional[str]) -> Path:
@@ -113,11 +393,11 @@ def _resolve_db_path(app: Flask, requested_db: Optional[str]) -> Path:
     if not requested_db.endswith('.db'):
         abort(400, description="Database name must end with '.db'.")
 
-    db_directory = Path(app.config["GAMES_DB_DIR"])
+    db_directory: Path = app.config["GAMES_DB_DIR_OBJ"]
     resolved_path = (db_directory / requested_db).resolve()
 
     try:
-        resolved_path.relative_to(db_directory.resolve())
+        resolved_path.relative_to(db_directory)
     except ValueError:
         abort(400, description="Invalid database path.")
 
@@ -131,20 +411,47 @@ def _get_request_db_path(app: Flask) -> Path:
     return _resolve_db_path(app, request.args.get("db"))
 
 
+def _parse_list_args(args: Mapping[str, str]) -> tuple[Optional[str], Optional[str]]:
+    """Return the ``(sql, question)`` query parameters of ``GET /api/games`` in one pass."""
+
+    return args.get("sql") or None, (args.get("question") or "").strip() or None
+
+
 def create_app(db_path: Optional[Path | str] = None) -> Flask:
     """Application factory for the board-game CRUD API."""
 
     if db_path is None:
         db_path = os.getenv("GAMES_DB_PATH", Path(__file__).with_name("games.db"))
+    # Only the directory is resolved: a symlinked database file keeps its own
+    # directory for "?db=" lookups. Done once here so per-request lookups reuse
+    # the same Path objects and "?db=games.db" shares the default cache key.
     db_path = Path(db_path)
+    db_path = db_path.parent.resolve() / db_path.name
 
     app = Flask(__name__)
     app.config["GAMES_DB_PATH"] = str(db_path)
-    app.config["GAMES_DB_DIR"] = str(db_path.parent.resolve())
+    app.config["GAMES_DB_PATH_OBJ"] = db_path
+    app.config["GAMES_DB_DIR"] = str(db_path.parent)
+    app.config["GAMES_DB_DIR_OBJ"] = db_path.parent
     app.config["JSON_SORT_KEYS"] = False
-
-    CORS(app)
-
+    # Connections are opened lazily and pooled per database file across requests
+    # and threads; "prepared" tracks the files whose WAL mode/indexes are set.
+    app.extensions["sqlite"] = {
+        "pools": {},
+        "lock": threading.Lock(),
+        "prepared": set(),
+    }
+    app.extensions["result_cache"] = _ResultCache()
+
+    @app.after_request
+    def add_cors_headers(response: Response) -> Response:
+        response.headers.update(_CORS_HEADERS)
+        if request.method == "OPTIONS":
+            response.headers.update(_CORS_PREFLIGHT_HEADERS)
+            requested_headers = request.headers.get("Access-Control-Request-Headers")
+            if requested_headers:
+                response.headers["Access-Control-Allow-Headers"] = requested_headers
+        return response
 
     @app.get("/api/config")
     def get_runtime_config() -> Any:
@@ -152,8 +459,7 @@ def create_app(db_path: Optional[Path | str] = None) -> Flask:
 
     @app.get("/api/games")
     def list_games() -> Any:
-        sql_query = request.args.get("sql")
-        question = request.args.get("question")
+        sql_query, question = _parse_list_args(request.args)
 
         if question:
             try:
@@ -171,39 +477,52 @@ def create_app(db_path: Optional[Path | str] = None) -> Flask:
 
             print(f"Generated SQL for question '{question}':\n{generated_sql}\n")
         elif sql_query:
-            normalized = sql_query.lstrip().lower()
-            if not normalized.startswith("select"):
+            if not _SELECT_RE.match(sql_query):
                 abort(400, description="Only SELECT statements are allowed.")
             query = sql_query
         else:
-            query = (
-                f"SELECT * FROM {TABLE_NAME} "
-                "ORDER BY nom_du_jeu COLLATE NOCASE"
-            )
+            query = _SQL_SELECT_ALL
 
         db_file = _get_request_db_path(app)
-        try:
-            with _connect(db_file) as connection:
-                cursor = connection.execute(query)
-                rows = cursor.fetchall()
-        except sqlite3.DatabaseError as exc:
-            abort(400, description=f"Invalid SQL query: {exc}")
+        cache = app.extensions["result_cache"]
+        # Lists are keyed by their exact SQL text: the frontend sends a handful
+        # of fixed ?sql= queries. Generated SQL (from ?question=) is not cached.
+        version = None if question else cache.version(db_file)
+        key = ("list", query)
+        games = cache.get(db_file, version, key)
+        if games is None:
+            try:
+                with _connection(app, db_file) as connection:
+                    cursor = connection.execute(query)
+                    rows = cursor.fetchall()
+            except sqlite3.DatabaseError as exc:
+                abort(400, description=f"Invalid SQL query: {exc}")
+
+            try:
+                getter = _column_getter(cursor.description)
+            except KeyError as exc:
+                abort(400, description=f"Invalid SQL query: missing column {exc}")
+
+            games = _rows_to_dicts(rows, getter)
+            cache.put(db_file, version, key, games)
 
-        games = [BoardGame.from_row(row).to_dict() for row in rows]
-        return jsonify(games)
+        return _json_array_response(games)
 
     @app.get("/api/games/<string:name>")
     def get_game(name: str) -> Any:
         db_file = _get_request_db_path(app)
-        with _connect(db_file) as connection:
-            cursor = connection.execute(
-                f"SELECT * FROM {TABLE_NAME} WHERE nom_du_jeu = ?",
-                (name,),
-            )
-            row = cursor.fetchone()
-        if row is None:
-            abort(404, description="Game not found.")
-        return jsonify(BoardGame.from_row(row).to_dict())
+        cache = app.extensions["result_cache"]
+        version = cache.version(db_file)
+        game = cache.get(db_file, version, ("game", name))
+        if game is None:
+            with _connection(app, db_file) as connection:
+                cursor = connection.execute(_SQL_SELECT_BY_NAME, (name,))
+                row = cursor.fetchone()
+            if row is None:
+                abort(404, description="Game not found.")
+            game = BoardGame.from_row(row)
+            cache.put(db_file, version, ("game", name), game)
+        return _json_response(game)
 
     @app.post("/api/games")
     def create_game() -> Any:
@@ -213,40 +532,13 @@ def create_app(db_path: Optional[Path | str] = None) -> Flask:
         game = _validate_payload(payload)
         db_file = _get_request_db_path(app)
         try:
-            with _connect(db_file) as connection:
-                connection.execute(
-                    f"""
-                    INSERT INTO {TABLE_NAME} (
-                        nom_du_jeu,
-                        temps_de_jeu,
-                        duree_min_minutes,
-                        duree_max_minutes,
-                        nombre_de_joueurs,
-                        joueurs_min,
-                        joueurs_max,
-                        en_equipe,
-                        support_particulier,
-                        type_de_jeu,
-                        tout_le_monde_peut_jouer
-                    ) VALUES (
-                        :nom_du_jeu,
-                        :temps_de_jeu,
-                        :duree_min_minutes,
-                        :duree_max_minutes,
-                        :nombre_de_joueurs,
-                        :joueurs_min,
-                        :joueurs_max,
-                        :en_equipe,
-                        :support_particulier,
-                        :type_de_jeu,
-                        :tout_le_monde_peut_jouer
-                    )
-                    """,
-                    game.to_db_params(),
-                )
+            with _write(app, db_file) as connection:
+                # fetchall() steps the statement to completion so autocommit ends it.
+                (row,) = connection.execute(_SQL_INSERT, game.to_db_params()).fetchall()
         except sqlite3.IntegrityError as exc:
             abort(409, description="A game with the same name already exists.")
-        return jsonify(game.to_dict()), 201
+        # Answer with what SQLite stored, after column affinity conversions.
+        return _json_response(BoardGame.from_row(row), 201)
 
     @app.put("/api/games/<string:name>")
     def update_game(name: str) -> Any:
@@ -255,59 +547,29 @@ def create_app(db_path: Optional[Path | str] = None) -> Flask:
             abort(400, description="A JSON body is required.")
 
         db_file = _get_request_db_path(app)
-        with _connect(db_file) as connection:
-            cursor = connection.execute(
-                f"SELECT * FROM {TABLE_NAME} WHERE nom_du_jeu = ?",
-                (name,),
-            )
-            row = cursor.fetchone()
-        if row is None:
-            abort(404, description="Game not found.")
-
-        existing = BoardGame.from_row(row)
-        updated_game = _validate_payload(payload, existing=existing)
-
-        params = updated_game.to_db_params()
-        params["original_name"] = name
-
         try:
-            with _connect(db_file) as connection:
-                cursor = connection.execute(
-                    f"""
-                    UPDATE {TABLE_NAME}
-                    SET
-                        nom_du_jeu = :nom_du_jeu,
-                        temps_de_jeu = :temps_de_jeu,
-                        duree_min_minutes = :duree_min_minutes,
-                        duree_max_minutes = :duree_max_minutes,
-                        nombre_de_joueurs = :nombre_de_joueurs,
-                        joueurs_min = :joueurs_min,
-                        joueurs_max = :joueurs_max,
-                        en_equipe = :en_equipe,
-                        support_particulier = :support_particulier,
-                        type_de_jeu = :type_de_jeu,
-                        tout_le_monde_peut_jouer = :tout_le_monde_peut_jouer
-                    WHERE nom_du_jeu = :original_name
-                    """,
-                    params,
-                )
+            # Read, merge and write in one transaction so a concurrent update
+            # cannot slip in between the SELECT and the UPDATE.
+            with _transaction(app, db_file) as connection:
+                row = connection.execute(_SQL_SELECT_BY_NAME, (name,)).fetchone()
+                if row is None:
+                    abort(404, description="Game not found.")
+
+                updated_game = _validate_payload(payload, existing=BoardGame.from_row(row))
+                params = updated_game.to_db_params()
+                params["original_name"] = name
+                row = connection.execute(_SQL_UPDATE, params).fetchone()
         except sqlite3.IntegrityError:
             abort(409, description="A game with the same name already exists.")
 
-        if cursor.rowcount == 0:
-            abort(404, description="Game not found.")
-
-        return jsonify(updated_game.to_dict())
+        return _json_response(BoardGame.from_row(row))
 
     @app.delete("/api/games/<string:name>")
     def delete_game(name: str) -> Any:
         db_file = _get_request_db_path(app)
-        with _connect(db_file) as connection:
-            cursor = connection.execute(
-                f"DELETE FROM {TABLE_NAME} WHERE nom_du_jeu = ?",
-                (name,),
-            )
-        if cursor.rowcount == 0:
+        with _write(app, db_file) as connection:
+            deleted = connection.execute(_SQL_DELETE, (name,)).fetchall()
+        if not deleted:
             abort(404, description="Game not found.")
         return ("", 204)
 
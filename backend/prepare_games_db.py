@@ -16,9 +16,10 @@ import argparse
 import csv
 import re
 import sqlite3
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterator, Optional, Sequence, Tuple
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
 
 
 COL_NOM_DU_JEU = "Nom du jeu"
@@ -55,11 +56,28 @@ HEADER_NORMALIZATION = {
 
 NULL_MARKERS = {"", "∅", "Ø"}
 
+_PAREN_RE = re.compile(r"\(.*?\)")
+
+# Single-character substitutions applied in one str.translate pass; runs of
+# whitespace are then collapsed with " ".join(text.split()).
+_HEADER_TT = str.maketrans({"\ufeff": None, "\r": " ", "\n": " "})
+_CELL_TT = str.maketrans({"\xa0": " ", "\r": " ", "\n": " ", "\u2013": "-"})
+_RANGE_TT = str.maketrans({"\u2013": "-", "à": "-", "~": "-"})
+
 TABLE_NAME = "jeux"
 
 
-@dataclass(frozen=True)
-class Jeu:
+# Read the CSV in 1 MiB chunks rather than io.DEFAULT_BUFFER_SIZE.
+READ_BUFFER_SIZE = 1024 * 1024
+
+BATCH_SIZE = 10_000
+# Rows per multi-VALUES INSERT; 500 x 11 parameters stays far below SQLite's
+# bound-variable limit.
+ROWS_PER_INSERT = 500
+
+
+class Jeu(NamedTuple):
+    # Field order is the column order of the INSERT statements.
     nom_du_jeu: str
     temps_de_jeu: Optional[str]
     duree_min_minutes: Optional[int]
@@ -73,49 +91,63 @@ class Jeu:
     tout_le_monde_peut_jouer: str
 
 
+_COLONNES = Jeu._fields
+_LIGNE = f"({', '.join('?' * len(_COLONNES))})"
+_INSERT_PREFIX = f"INSERT INTO {TABLE_NAME} ({', '.join(_COLONNES)}) VALUES "
+_INSERT_ONE_SQL = _INSERT_PREFIX + _LIGNE
+_INSERT_MANY_SQL = _INSERT_PREFIX + ", ".join([_LIGNE] * ROWS_PER_INSERT)
+
+
 def clean_header(value: Optional[str]) -> str:
     if value is None:
         return ""
-    sanitized = (
-        value.replace("\ufeff", "")
-        .replace("\r", " ")
-        .replace("\n", " ")
-    )
-    sanitized = re.sub(r"\s+", " ", sanitized).strip()
+    # Headers usually arrive in a known spelling; skip sanitizing those.
+    connu = HEADER_NORMALIZATION.get(value)
+    if connu is not None:
+        return connu
+    sanitized = " ".join(value.translate(_HEADER_TT).split())
     return HEADER_NORMALIZATION.get(sanitized, sanitized)
 
 
 def clean_cell(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
-    sanitized = (
-        value.replace("\xa0", " ")
-        .replace("\r", " ")
-        .replace("\n", " ")
-        .replace("\u2013", "-")
-    )
-    sanitized = re.sub(r"\s+", " ", sanitized).strip()
+    sanitized = " ".join(value.translate(_CELL_TT).split())
     if sanitized in NULL_MARKERS:
         return None
     return sanitized
 
 
+def _first_number(token: str) -> Optional[int]:
+    # Equivalent to re.search(r"(\d+)", token) without going through the regex engine.
+    if token.isdecimal():
+        return int(token)
+    start = None
+    for pos, char in enumerate(token):
+        if char.isdecimal():
+            if start is None:
+                start = pos
+        elif start is not None:
+            return int(token[start:pos])
+    return int(token[start:]) if start is not None else None
+
+
+@lru_cache(maxsize=256)
 def parse_duree(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     if not value:
         return None, None
 
     text = value.lower()
-    text = re.sub(r"\(.*?\)", "", text)
-    text = text.replace("\u2013", "-").replace("à", "-").replace("~", "-")
+    text = _PAREN_RE.sub("", text)
+    text = text.translate(_RANGE_TT)
     tokens = [token.strip() for token in text.split("-") if token.strip()]
     unit_hint = "min" if "min" in text else ("h" if "h" in text else None)
 
     minutes: list[int] = []
     for token in tokens:
-        match = re.search(r"(\d+)", token)
-        if not match:
+        number = _first_number(token)
+        if number is None:
             continue
-        number = int(match.group(1))
         unit = (
             "h"
             if "h" in token
@@ -132,26 +164,21 @@ def parse_duree(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     return min(minutes), max(minutes)
 
 
+@lru_cache(maxsize=256)
 def parse_joueurs(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     if not value:
         return None, None
 
     text = value.lower()
-    text = (
-        text.replace("joueurs", "")
-        .replace("joueur", "")
-        .replace("\u2013", "-")
-        .replace("à", "-")
-        .replace("~", "-")
-    )
+    text = text.replace("joueurs", "").replace("joueur", "").translate(_RANGE_TT)
     tokens = [token.strip() for token in text.split("-") if token.strip()]
 
     joueurs: list[int] = []
     for token in tokens:
-        match = re.search(r"(\d+)", token)
-        if not match:
+        number = _first_number(token)
+        if number is None:
             continue
-        joueurs.append(int(match.group(1)))
+        joueurs.append(number)
 
     if not joueurs:
         return None, None
@@ -174,7 +201,9 @@ def normalize_tout_le_monde(value: Optional[str]) -> str:
 
 
 def iter_clean_rows(csv_path: Path) -> Iterator[Jeu]:
-    with csv_path.open("r", encoding="utf-8", newline="") as handle:
+    with csv_path.open(
+        "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE
+    ) as handle:
         reader = csv.reader(handle)
         try:
             raw_headers = next(reader)
@@ -197,21 +226,25 @@ def iter_clean_rows(csv_path: Path) -> Iterator[Jeu]:
         if manquants:
             raise ValueError(f"Colonnes manquantes dans le CSV: {', '.join(manquants)}")
 
-        def raw_value(row: Sequence[str], column: str) -> Optional[str]:
-            pos = index[column]
-            return row[pos] if pos < len(row) else None
+        positions = [index[name] for name in expected_columns]
+        i_nom, i_temps, i_nombre, i_equipe, i_support, i_type, i_tous = positions
+        largeur = max(positions) + 1
 
         for line_number, raw_row in enumerate(reader, start=2):
-            nom_jeu = clean_cell(raw_value(raw_row, COL_NOM_DU_JEU))
+            if len(raw_row) < largeur:
+                # Short rows read as missing cells, as before.
+                raw_row += [None] * (largeur - len(raw_row))
+
+            nom_jeu = clean_cell(raw_row[i_nom])
             if not nom_jeu:
                 raise ValueError(f"Ligne {line_number}: le nom du jeu est manquant.")
 
-            temps_de_jeu = clean_cell(raw_value(raw_row, COL_TEMPS_DE_JEU))
-            nombre_de_joueurs = clean_cell(raw_value(raw_row, COL_NOMBRE_DE_JOUEURS))
-            en_equipe = clean_cell(raw_value(raw_row, COL_EN_EQUIPE))
-            support_particulier = normalize_support(raw_value(raw_row, COL_SUPPORT))
-            type_de_jeu = clean_cell(raw_value(raw_row, COL_TYPE_DE_JEU))
-            tout_le_monde = normalize_tout_le_monde(raw_value(raw_row, COL_TOUT_LE_MONDE))
+            temps_de_jeu = clean_cell(raw_row[i_temps])
+            nombre_de_joueurs = clean_cell(raw_row[i_nombre])
+            en_equipe = clean_cell(raw_row[i_equipe])
+            support_particulier = normalize_support(raw_row[i_support])
+            type_de_jeu = clean_cell(raw_row[i_type])
+            tout_le_monde = normalize_tout_le_monde(raw_row[i_tous])
 
             duree_min, duree_max = parse_duree(temps_de_jeu)
             joueurs_min, joueurs_max = parse_joueurs(nombre_de_joueurs)
@@ -231,71 +264,89 @@ def iter_clean_rows(csv_path: Path) -> Iterator[Jeu]:
             )
 
 
-def create_database(db_path: Path, jeux: Sequence[Jeu]) -> None:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(db_path)
-    try:
-        cursor = connection.cursor()
-        cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
-        cursor.execute(
-            f"""
-            CREATE TABLE {TABLE_NAME} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nom_du_jeu TEXT NOT NULL UNIQUE,
-                temps_de_jeu TEXT,
-                duree_min_minutes INTEGER,
-                duree_max_minutes INTEGER,
-                nombre_de_joueurs TEXT,
-                joueurs_min INTEGER,
-                joueurs_max INTEGER,
-                en_equipe TEXT,
-                support_particulier TEXT,
-                type_de_jeu TEXT,
-                tout_le_monde_peut_jouer TEXT
-            )
-            """
+def _chunks(jeux: Iterable[Jeu], taille: int) -> Iterator[list[Jeu]]:
+    iterateur = iter(jeux)
+    while lot := list(islice(iterateur, taille)):
+        yield lot
+
+
+def _fill_table(cursor: sqlite3.Cursor, jeux: Iterable[Jeu]) -> int:
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    cursor.execute(
+        f"""
+        CREATE TABLE {TABLE_NAME} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nom_du_jeu TEXT NOT NULL UNIQUE,
+            temps_de_jeu TEXT,
+            duree_min_minutes INTEGER,
+            duree_max_minutes INTEGER,
+            nombre_de_joueurs TEXT,
+            joueurs_min INTEGER,
+            joueurs_max INTEGER,
+            en_equipe TEXT,
+            support_particulier TEXT,
+            type_de_jeu TEXT,
+            tout_le_monde_peut_jouer TEXT
         )
+        """
+    )
 
-        cursor.executemany(
-            f"""
-            INSERT INTO {TABLE_NAME} (
-                nom_du_jeu,
-                temps_de_jeu,
-                duree_min_minutes,
-                duree_max_minutes,
-                nombre_de_joueurs,
-                joueurs_min,
-                joueurs_max,
-                en_equipe,
-                support_particulier,
-                type_de_jeu,
-                tout_le_monde_peut_jouer
-            ) VALUES (
-                :nom_du_jeu,
-                :temps_de_jeu,
-                :duree_min_minutes,
-                :duree_max_minutes,
-                :nombre_de_joueurs,
-                :joueurs_min,
-                :joueurs_max,
-                :en_equipe,
-                :support_particulier,
-                :type_de_jeu,
-                :tout_le_monde_peut_jouer
+    inseres = 0
+    for lot in _chunks(jeux, BATCH_SIZE):
+        # Jeu is a tuple, so rows bind positionally as they are.
+        complet = len(lot) - len(lot) % ROWS_PER_INSERT
+        for debut in range(0, complet, ROWS_PER_INSERT):
+            cursor.execute(
+                _INSERT_MANY_SQL,
+                list(chain.from_iterable(lot[debut:debut + ROWS_PER_INSERT])),
             )
-            """,
-            [jeu.__dict__ for jeu in jeux],
-        )
-        connection.commit()
+        # Leftover rows that do not fill a multi-row statement.
+        cursor.executemany(_INSERT_ONE_SQL, lot[complet:])
+        inseres += len(lot)
+
+    # Indexes are built once the rows are in rather than maintained per insert.
+    # Names match the ones backend/app.py creates with IF NOT EXISTS.
+    cursor.execute(
+        f"CREATE INDEX idx_jeux_nom_nocase ON {TABLE_NAME}(nom_du_jeu COLLATE NOCASE)"
+    )
+    cursor.execute(
+        f"CREATE INDEX idx_jeux_joueurs ON {TABLE_NAME}(joueurs_min, joueurs_max)"
+    )
+    cursor.execute(
+        f"CREATE INDEX idx_jeux_duree ON {TABLE_NAME}(duree_min_minutes, duree_max_minutes)"
+    )
+    cursor.execute(f"ANALYZE {TABLE_NAME}")
+    return inseres
+
+
+def create_database(db_path: Path, jeux: Iterable[Jeu]) -> int:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-65536")
+
+        cursor = connection.cursor()
+        # Drop, create and fill the table in one explicit transaction.
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            inseres = _fill_table(cursor, jeux)
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
     finally:
         connection.close()
+    return inseres
 
 
 def run(csv_path: Path, db_path: Path) -> int:
-    jeux = list(iter_clean_rows(csv_path))
-    create_database(db_path, jeux)
-    print(f"{len(jeux)} jeux importés dans {db_path}.")
-    return len(jeux)
+    # Rows are parsed lazily while executemany consumes them.
+    nombre = create_database(db_path, iter_clean_rows(csv_path))
+    print(f"{nombre} jeux importés dans {db_path}.")
+    return nombre
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import shutil
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -10,7 +12,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.app import BoardGame, TABLE_NAME, create_app
+import backend.app as app_module
+from backend.app import COLUMN_MAP, BoardGame, TABLE_NAME, create_app
 
 
 CREATE_TABLE_SQL = f"""
@@ -31,9 +34,10 @@ CREATE TABLE {TABLE_NAME} (
 """
 
 
-@pytest.fixture()
-def app(tmp_path: Path):
-    db_path = tmp_path / "games.db"
+@pytest.fixture(scope="session")
+def _db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Built once per session; each test gets its own copy.
+    db_path = tmp_path_factory.mktemp("template") / "games.db"
     connection = sqlite3.connect(db_path)
     with connection:
         connection.execute(CREATE_TABLE_SQL)
@@ -81,6 +85,13 @@ def app(tmp_path: Path):
             seed.to_db_params(),
         )
     connection.close()
+    return db_path
+
+
+@pytest.fixture()
+def app(tmp_path: Path, _db_template: Path):
+    db_path = tmp_path / "games.db"
+    shutil.copyfile(_db_template, db_path)
 
     flask_app = create_app(db_path)
     flask_app.config.update({"TESTING": True})
@@ -113,6 +124,12 @@ def test_rejects_non_select_statements(client):
     assert response.status_code == 400
 
 
+def test_rejects_statements_that_only_start_like_select(client):
+    response = client.get("/api/games", query_string={"sql": "selected FROM jeux"})
+    assert response.status_code == 400
+    assert b"Only SELECT" in response.data
+
+
 def test_natural_language_question(client, monkeypatch):
     captured = {}
 
@@ -190,6 +207,21 @@ def test_cors_headers(client):
     assert response.headers.get("Access-Control-Allow-Origin") == "*"
 
 
+def test_cors_preflight(client):
+    response = client.options(
+        "/api/games/Test Game",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "PUT",
+            "Access-Control-Request-Headers": "Content-Type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers.get("Access-Control-Allow-Origin") == "*"
+    assert "PUT" in response.headers.get("Access-Control-Allow-Methods")
+    assert response.headers.get("Access-Control-Allow-Headers") == "Content-Type"
+
+
 def test_database_schema_constraints(app):
     db_path = Path(app.config["GAMES_DB_PATH"])
     with sqlite3.connect(db_path) as connection:
@@ -260,3 +292,211 @@ def test_runtime_config_exposes_openai_availability(client):
     assert response.status_code == 200
     payload = response.get_json()
     assert isinstance(payload.get("openai_enabled"), bool)
+
+
+def test_board_game_fields_follow_column_map():
+    assert tuple(BoardGame.__dataclass_fields__) == tuple(COLUMN_MAP)
+
+    game = BoardGame(name="Round Trip", min_players=2, game_type="Party")
+    row = tuple(game.to_db_params().values())
+    assert BoardGame.from_row(row) == game
+    assert tuple(game.to_dict()) == tuple(COLUMN_MAP)
+    assert game.to_dict()["game_type"] == "Party"
+
+
+def test_create_duplicate_game_rolls_back(client):
+    response = client.post("/api/games", json={"name": "Test Game"})
+    assert response.status_code == 409
+
+    follow_up = client.post("/api/games", json={"name": "Another Game"})
+    assert follow_up.status_code == 201
+
+
+def test_list_games_rejects_partial_column_selection(client):
+    response = client.get("/api/games", query_string={"sql": "SELECT nom_du_jeu FROM jeux"})
+    assert response.status_code == 400
+
+
+def test_connection_creates_sort_and_filter_indexes(client, app):
+    assert client.get("/api/games").status_code == 200
+
+    with sqlite3.connect(app.config["GAMES_DB_PATH"]) as connection:
+        indexes = {row[1] for row in connection.execute(f"PRAGMA index_list({TABLE_NAME})")}
+
+    assert {"idx_jeux_nom_nocase", "idx_jeux_joueurs", "idx_jeux_duree"} <= indexes
+
+
+def test_read_only_database_is_served(client, monkeypatch):
+    def open_read_only(db_path):
+        # Behaves like a file without write permission, even when run as root.
+        return sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, isolation_level=None)
+
+    monkeypatch.setattr("backend.app._open_connection", open_read_only)
+
+    assert client.get("/api/games").status_code == 200
+    assert client.get("/api/games/Test Game").status_code == 200
+
+
+def test_create_game_rejects_unknown_fields(client):
+    response = client.post("/api/games", json={"name": "Odd Game", "rating": 5})
+    assert response.status_code == 400
+    assert b"rating" in response.data
+
+
+def test_concurrent_reads_through_the_pool_succeed(app):
+    results = []
+
+    def read_games():
+        with app.test_client() as thread_client:
+            response = thread_client.get("/api/games")
+            results.append((response.status_code, response.get_json()[0]["name"]))
+
+    threads = [threading.Thread(target=read_games) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [(200, "Test Game")] * 4
+
+
+def test_connections_are_reused_across_request_threads(app, monkeypatch):
+    opened = []
+    open_connection = app_module._open_connection
+
+    def counting_open(db_path):
+        opened.append(db_path)
+        return open_connection(db_path)
+
+    monkeypatch.setattr(app_module, "_open_connection", counting_open)
+
+    def read_game(limit):
+        # Distinct SQL so every read misses the result cache, each from a
+        # fresh thread like Werkzeug's dev server.
+        with app.test_client() as thread_client:
+            sql = f"SELECT * FROM jeux LIMIT {limit}"
+            response = thread_client.get("/api/games", query_string={"sql": sql})
+            assert response.status_code == 200
+
+    for limit in range(1, 21):
+        thread = threading.Thread(target=read_game, args=(limit,))
+        thread.start()
+        thread.join()
+
+    assert len(opened) == 1
+
+
+def test_cached_reads_see_writes(client):
+    assert [game["name"] for game in client.get("/api/games").get_json()] == ["Test Game"]
+    assert client.get("/api/games/Test Game").get_json()["min_players"] == 2
+
+    client.post("/api/games", json={"name": "Cached Game"})
+    client.put("/api/games/Test Game", json={"min_players": 3})
+
+    names = [game["name"] for game in client.get("/api/games").get_json()]
+    assert names == ["Cached Game", "Test Game"]
+    assert client.get("/api/games/Test Game").get_json()["min_players"] == 3
+
+    client.delete("/api/games/Cached Game")
+    assert client.get("/api/games/Cached Game").status_code == 404
+
+
+def test_cached_reads_see_writes_from_other_processes(app):
+    client = app.test_client()
+    other_client = create_app(app.config["GAMES_DB_PATH"]).test_client()
+    assert len(client.get("/api/games").get_json()) == 1
+    assert client.get("/api/games/Test Game").get_json()["min_players"] == 2
+
+    other_client.post("/api/games", json={"name": "Other Worker Game"})
+    with sqlite3.connect(app.config["GAMES_DB_PATH"]) as connection:
+        connection.execute(f"UPDATE {TABLE_NAME} SET joueurs_min = 3 WHERE nom_du_jeu = 'Test Game'")
+
+    assert len(client.get("/api/games").get_json()) == 2
+    assert client.get("/api/games/Test Game").get_json()["min_players"] == 3
+
+
+def test_repeated_sql_reads_are_served_from_cache(client, monkeypatch):
+    opened = []
+    connection = app_module._connection
+
+    def counting_connection(app, db_path):
+        opened.append(db_path)
+        return connection(app, db_path)
+
+    # The first connection sets up WAL/indexes, which bumps data_version.
+    client.get("/api/games/Test Game")
+    monkeypatch.setattr(app_module, "_connection", counting_connection)
+    sql = {"sql": "SELECT * FROM jeux ORDER BY nom_du_jeu COLLATE NOCASE ASC"}
+
+    for _ in range(5):
+        assert len(client.get("/api/games", query_string=sql).get_json()) == 1
+    assert len(opened) == 1
+
+    client.post("/api/games", json={"name": "Another Game"})
+    reads = len(opened)
+    assert len(client.get("/api/games", query_string=sql).get_json()) == 2
+    assert len(opened) == reads + 1
+
+
+def test_update_missing_game_returns_404(client):
+    response = client.put("/api/games/Unknown Game", json={"min_players": 3})
+    assert response.status_code == 404
+
+
+def test_update_game_rename_conflict(client):
+    client.post("/api/games", json={"name": "Other Game"})
+    response = client.put("/api/games/Other Game", json={"name": "Test Game"})
+    assert response.status_code == 409
+    assert client.get("/api/games/Other Game").status_code == 200
+
+
+def test_default_database_selected_by_name_shares_cache(client):
+    assert len(client.get("/api/games").get_json()) == 1
+
+    response = client.post("/api/games", json={"name": "Named Db Game"}, query_string={"db": "games.db"})
+    assert response.status_code == 201
+
+    assert len(client.get("/api/games").get_json()) == 2
+
+
+def test_symlinked_database_keeps_its_own_directory(tmp_path, _db_template):
+    data_dir = tmp_path / "data"
+    app_dir = tmp_path / "app"
+    data_dir.mkdir()
+    app_dir.mkdir()
+    shutil.copyfile(_db_template, data_dir / "games.db")
+    shutil.copyfile(_db_template, app_dir / "extra.db")
+    (app_dir / "games.db").symlink_to(data_dir / "games.db")
+
+    flask_app = create_app(app_dir / "games.db")
+    client = flask_app.test_client()
+
+    assert flask_app.config["GAMES_DB_DIR_OBJ"] == app_dir.resolve()
+    assert client.get("/api/games").status_code == 200
+    assert client.get("/api/games", query_string={"db": "extra.db"}).status_code == 200
+
+
+def test_create_game_returns_stored_values(client):
+    response = client.post("/api/games", json={"name": "Typed Game", "min_players": "3"})
+    assert response.status_code == 201
+    assert response.get_json()["min_players"] == 3
+
+
+def test_delete_missing_game_returns_404(client):
+    response = client.delete("/api/games/Unknown Game")
+    assert response.status_code == 404
+
+
+def test_list_games_streams_results_across_batches(client, app):
+    with sqlite3.connect(app.config["GAMES_DB_PATH"]) as connection:
+        connection.executemany(
+            f"INSERT INTO {TABLE_NAME} (nom_du_jeu, joueurs_min) VALUES (?, ?)",
+            [(f"Bulk Game {index:03d}", index) for index in range(300)],
+        )
+
+    response = client.get("/api/games")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert len(payload) == 301
+    assert payload[0]["name"] == "Bulk Game 000"
+    assert payload[-1]["name"] == "Test Game"
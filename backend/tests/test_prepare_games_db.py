@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import csv
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend import prepare_games_db
+from backend.prepare_games_db import (
+    COL_SUPPORT,
+    COL_TOUT_LE_MONDE,
+    ROWS_PER_INSERT,
+    TABLE_NAME,
+    clean_header,
+    parse_duree,
+    parse_joueurs,
+)
+
+
+HEADERS = [
+    "Nom du jeu",
+    "Temps de jeu",
+    "Nombre de joueurs",
+    "En équipe ?",
+    "Support particulier\nsupplémentaire",
+    "Type de jeu",
+    "Tout le monde \npeut jouer ?",
+]
+
+
+def _write_csv(path: Path, rows: list[list[str]]) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(HEADERS)
+        writer.writerows(rows)
+    return path
+
+
+def _row(number: int) -> list[str]:
+    return [f"Jeu {number:05d}", "20-40 min", "2-4 joueurs", "non", "∅", "Cartes", ""]
+
+
+def _count(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, ""),
+        ("", "Nom du jeu"),
+        ("\ufeffNom du jeu", "Nom du jeu"),
+        ("Support particulier\r\nsupplémentaire", COL_SUPPORT),
+        ("Tout le monde \npeut jouer ?", COL_TOUT_LE_MONDE),
+        ("  Colonne\n inconnue ", "Colonne inconnue"),
+    ],
+)
+def test_clean_header(value, expected):
+    assert clean_header(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, (None, None)),
+        ("", (None, None)),
+        ("30 min", (30, 30)),
+        ("20-40 min", (20, 40)),
+        ("1h - 2h", (60, 120)),
+        ("45 min à 1h", (45, 60)),
+        ("45 min (variante 2h)", (45, 45)),
+        ("variable", (None, None)),
+    ],
+)
+def test_parse_duree(value, expected):
+    assert parse_duree(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, (None, None)),
+        ("1 joueur", (1, 1)),
+        ("2-4 joueurs", (2, 4)),
+        ("2 à 6", (2, 6)),
+        ("3~8 joueurs", (3, 8)),
+        ("illimité", (None, None)),
+    ],
+)
+def test_parse_joueurs(value, expected):
+    assert parse_joueurs(value) == expected
+
+
+def test_quoted_multiline_headers_are_recognised(tmp_path):
+    csv_path = _write_csv(tmp_path / "jeux.csv", [_row(1)])
+
+    (jeu,) = prepare_games_db.iter_clean_rows(csv_path)
+
+    assert jeu.nom_du_jeu == "Jeu 00001"
+    assert jeu.support_particulier is None
+    assert jeu.tout_le_monde_peut_jouer == "oui"
+
+
+def test_import_spans_several_multi_row_inserts(tmp_path):
+    nombre = 2 * ROWS_PER_INSERT + 234
+    csv_path = _write_csv(tmp_path / "jeux.csv", [_row(i) for i in range(nombre)])
+    db_path = tmp_path / "games.db"
+
+    assert prepare_games_db.run(csv_path, db_path) == nombre
+    assert _count(db_path) == nombre
+
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(
+            f"SELECT nom_du_jeu, duree_min_minutes, duree_max_minutes, joueurs_min, "
+            f"joueurs_max, support_particulier, tout_le_monde_peut_jouer "
+            f"FROM {TABLE_NAME} ORDER BY id"
+        ).fetchall()
+    assert [row[0] for row in rows] == [f"Jeu {i:05d}" for i in range(nombre)]
+    assert set(row[1:] for row in rows) == {(20, 40, 2, 4, None, "oui")}
+
+
+def test_failed_import_keeps_the_existing_table(tmp_path):
+    db_path = tmp_path / "games.db"
+    prepare_games_db.run(_write_csv(tmp_path / "ok.csv", [_row(i) for i in range(3)]), db_path)
+
+    rows = [_row(i) for i in range(ROWS_PER_INSERT + 10)]
+    rows[ROWS_PER_INSERT + 5][0] = ""
+    bad_csv = _write_csv(tmp_path / "bad.csv", rows)
+
+    with pytest.raises(ValueError, match=f"Ligne {ROWS_PER_INSERT + 7}"):
+        prepare_games_db.run(bad_csv, db_path)
+
+    assert _count(db_path) == 3
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend import text_to_sql
+from backend.text_to_sql import is_sql_safe
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT * FROM jeux ORDER BY nom_du_jeu",
+        "  select *\nfrom\tjeux\nWHERE joueurs_min <= 2\nORDER BY nom_du_jeu",
+        "SELECT * FROM jeux WHERE type_de_jeu LIKE '%Coopératif%' ORDER BY nom_du_jeu",
+        "SELECT * FROM JEUX WHERE Joueurs_Min <= 2 ORDER BY NOM_DU_JEU",
+    ],
+)
+def test_accepts_select_from_jeux(sql):
+    assert is_sql_safe(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        None,
+        "SELECT 1",
+        "selected * FROM jeux",
+        "\u017felect * FROM jeux",
+        "SELECT * FROM\xa0jeux",
+        "WITH t AS (SELECT * FROM jeux) SELECT * FROM t",
+        "SELECT * FROM jeux; DROP TABLE jeux",
+        "SELECT * FROM jeux WHERE nom_du_jeu IN (DELETE FROM jeux)",
+        "SELECT password FROM jeux",
+        "SELECT * FROM jeux WHERE nom_du_jeué = 1",
+    ],
+)
+def test_rejects_unsafe_sql(sql):
+    assert not is_sql_safe(sql)
+
+
+def test_rejects_oversized_sql():
+    padding = " AND joueurs_min >= 1" * 200
+    sql = f"SELECT * FROM jeux WHERE joueurs_min >= 1{padding} ORDER BY nom_du_jeu"
+
+    assert len(sql) > text_to_sql.MAX_SQL_LENGTH
+    assert not is_sql_safe(sql)
+    assert is_sql_safe(sql.replace(padding, ""))
+
+
+class _FakeStream:
+    def __init__(self, content: str, chunk_size: int = 4):
+        self.pieces = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        self.sent = 0
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            self.sent += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+        self.content = "SELECT * FROM jeux ORDER BY nom_du_jeu\n"
+        self.stream = None
+
+    def create(self, stream: bool = False, **_kwargs):
+        self.calls += 1
+        if stream:
+            self.stream = _FakeStream(self.content)
+            return self.stream
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class _FakeAsyncStream(_FakeStream):
+    async def __aiter__(self):
+        for chunk in _FakeStream.__iter__(self):
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, stream: bool = False, **_kwargs):
+        self.calls += 1
+        self.stream = _FakeAsyncStream(self.content)
+        return self.stream
+
+
+@pytest.fixture()
+def fake_completions(monkeypatch):
+    completions = _FakeCompletions()
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(text_to_sql, "_client", fake_client)
+    text_to_sql._generate_sql.cache_clear()
+    yield completions
+    text_to_sql._generate_sql.cache_clear()
+
+
+def test_repeated_question_is_served_from_cache(fake_completions):
+    first = text_to_sql.generate_sql_from_question("jeux  pour 2 joueurs")
+    second = text_to_sql.generate_sql_from_question(" jeux pour 2\njoueurs ")
+
+    assert first == second == "SELECT * FROM jeux ORDER BY nom_du_jeu"
+    assert fake_completions.calls == 1
+
+
+def test_streaming_stops_at_forbidden_keyword(fake_completions):
+    fake_completions.content = (
+        "SELECT * FROM jeux WHERE nom_du_jeu IN (DELETE FROM jeux) ORDER BY nom_du_jeu"
+    )
+
+    sql = text_to_sql.generate_sql_from_question("supprimer")
+
+    assert not is_sql_safe(sql)
+    assert fake_completions.stream.closed
+    assert fake_completions.stream.sent < len(fake_completions.stream.pieces)
+
+
+def test_async_generation_streams_from_async_client(fake_completions, monkeypatch):
+    completions = _FakeAsyncCompletions()
+    monkeypatch.setattr(
+        text_to_sql, "_aclient", SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    )
+
+    sql = asyncio.run(text_to_sql.generate_sql_from_question_async("tous les jeux"))
+
+    assert sql == "SELECT * FROM jeux ORDER BY nom_du_jeu"
+    assert completions.stream.closed
+    assert fake_completions.calls == 0
+
+
+def test_batch_questions_use_a_single_call(fake_completions):
+    fake_completions.content = (
+        "A1: SELECT * FROM jeux WHERE joueurs_min <= 2\nORDER BY nom_du_jeu\n"
+        "A2: SELECT * FROM jeux ORDER BY nom_du_jeu\n"
+    )
+
+    sqls = text_to_sql.generate_sql_from_questions(["jeux à 2", "tous les jeux"])
+
+    assert sqls == [
+        "SELECT * FROM jeux WHERE joueurs_min <= 2\nORDER BY nom_du_jeu",
+        "SELECT * FROM jeux ORDER BY nom_du_jeu",
+    ]
+    assert fake_completions.calls == 1
+
+
+def test_batch_questions_drop_unsafe_answers(fake_completions):
+    fake_completions.content = (
+        "A1: SELECT * FROM jeux ORDER BY nom_du_jeu\n"
+        "A2: DELETE FROM jeux\n"
+        "A3: SELECT password FROM jeux\n"
+    )
+
+    sqls = text_to_sql.generate_sql_from_questions(["tous", "supprimer", "mot de passe"])
+
+    assert sqls == ["SELECT * FROM jeux ORDER BY nom_du_jeu", None, None]
+
+
+def test_batch_questions_reject_incomplete_answers(fake_completions):
+    fake_completions.content = "A1: SELECT * FROM jeux ORDER BY nom_du_jeu"
+
+    with pytest.raises(RuntimeError):
+        text_to_sql.generate_sql_from_questions(["jeux à 2", "tous les jeux"])
+
+
+class _FakeHttpxClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class _FakeHttpxAsyncClient(_FakeHttpxClient):
+    pass
+
+
+@pytest.fixture()
+def fake_httpx(monkeypatch):
+    fake = SimpleNamespace(
+        Client=_FakeHttpxClient,
+        AsyncClient=_FakeHttpxAsyncClient,
+        Limits=lambda **kwargs: ("limits", kwargs),
+        Timeout=lambda *args, **kwargs: ("timeout", args, kwargs),
+    )
+    monkeypatch.setattr(text_to_sql, "httpx", fake)
+    return fake
+
+
+@pytest.mark.parametrize("http2", [True, False])
+def test_http_client_is_pooled_and_uses_http2_when_available(fake_httpx, monkeypatch, http2):
+    monkeypatch.setattr(text_to_sql, "HTTP2_AVAILABLE", http2)
+
+    sync_client = text_to_sql._http_client()
+    async_client = text_to_sql._http_client(asynchronous=True)
+
+    assert type(sync_client) is _FakeHttpxClient
+    assert type(async_client) is _FakeHttpxAsyncClient
+    assert sync_client.kwargs == {
+        "http2": http2,
+        "limits": ("limits", {"max_keepalive_connections": 20, "max_connections": 40}),
+        "timeout": ("timeout", (30.0,), {"connect": 5.0}),
+    }
+
+
+def test_http_client_falls_back_without_httpx(monkeypatch):
+    monkeypatch.setattr(text_to_sql, "httpx", None)
+
+    assert text_to_sql._http_client() is None
+
+
+def test_get_client_builds_openai_on_the_pooled_transport(fake_httpx, monkeypatch):
+    created = {}
+
+    def fake_openai(**kwargs):
+        created.update(kwargs)
+        return SimpleNamespace()
+
+    monkeypatch.setattr(text_to_sql, "openai", object())
+    monkeypatch.setattr(text_to_sql, "OpenAI", fake_openai)
+    monkeypatch.setattr(text_to_sql, "_api_key", lambda: "test-key")
+    monkeypatch.setattr(text_to_sql, "_client", None)
+
+    client = text_to_sql._get_client()
+
+    assert text_to_sql._get_client() is client
+    assert created["api_key"] == "test-key"
+    assert type(created["http_client"]) is _FakeHttpxClient
@@ -1,5 +1,8 @@
+import logging
 import os
 import re
+from functools import lru_cache
+from typing import Optional
 
 try:  # pragma: no cover - optional dependency
     from dotenv import load_dotenv
@@ -9,121 +12,236 @@ except ModuleNotFoundError:  # pragma: no cover - tests may not have python-dote
 
 try:  # pragma: no cover - import guard for optional dependency
     import openai
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime when used
     openai = None
 
-# Load environment variables from .env file
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
+try:  # pragma: no cover - transport used by openai>=1 clients
+    import httpx
+except ModuleNotFoundError:  # pragma: no cover - let openai pick its own transport
+    httpx = None
 
+try:  # pragma: no cover - HTTP/2 needs the h2 package (httpx[http2])
+    import h2  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - fall back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
 
-def is_openai_available() -> bool:
-    return openai is not None and bool(api_key)
+_log = logging.getLogger(__name__)
 
+# Created on first use, so importing the module (e.g. just for is_sql_safe)
+# neither reads .env nor builds HTTP clients.
+_client = None
+_aclient = None
 
-client = OpenAI(api_key=api_key) if is_openai_available() else None
 
-def generate_sql_from_question(question: str) -> str:
+@lru_cache(maxsize=None)
+def _api_key() -> Optional[str]:
+    # Load environment variables from .env file
+    load_dotenv()
+    return os.getenv("OPENAI_API_KEY")
+
+
+def is_openai_available() -> bool:
+    return openai is not None and bool(_api_key())
+
+
+def _http_client(asynchronous: bool = False):
+    if httpx is None:
+        return None  # openai picks its default transport
+    # One pooled connection reused across questions; over HTTP/2 concurrent
+    # requests share it instead of each paying for a TLS handshake.
+    http_client_class = httpx.AsyncClient if asynchronous else httpx.Client
+    return http_client_class(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+
+def _require_api_key() -> str:
     if openai is None:
         raise RuntimeError("OpenAI client is not available. Install openai to enable text-to-SQL.")
-    if not api_key or client is None:
+    api_key = _api_key()
+    if not api_key:
         raise RuntimeError(
             "OPENAI_API_KEY introuvable. Vérifie backend/.env ou tes variables d'environnement."
         )
-    # 1. Define schema description
-    schema_description = """
-    Tu es un assistant SQL. Tu écris uniquement du SQL SQLite.
-    Base de données des jeux : table `jeux`.
-
-    Colonnes de la table `jeux` :
-    - nom_du_jeu TEXT : le nom du jeu
-    - temps_de_jeu TEXT : durée lisible, ex "10 - 20 min" (privilégie les colonnes duree_min_minutes et duree_max_minutes pour les filtres de durée)
-    - duree_min_minutes INTEGER : durée minimum en minutes
-    - duree_max_minutes INTEGER : durée maximum en minutes
-    - nombre_de_joueurs TEXT : ex "2 à 4" (privilégie les colonnes joueurs_min et joueurs_max pour les filtres de nombre de joueurs)
-    - joueurs_min INTEGER : nombre minimum de joueurs
-    - joueurs_max INTEGER : nombre maximum de joueurs
-    - en_equipe TEXT : "OUI" si jeu en équipes, "AU CHOIX" si en équipes possibles, "NON" sinon
-    - support_particulier TEXT : ex "Cartes, Dés"
-    - type_de_jeu TEXT : ex "Connaissances, Rapidité", "Compétitif"
-    - tout_le_monde_peut_jouer TEXT : "oui" si accessible à tout le monde, "non" sinon, ou indique un élément spécifique (ex "calculs", "Réflexion, culture précise")
-
-    Règles :
-    - Réponds avec UNE SEULE requête SELECT valide pour SQLite.
-    - Utilise uniquement la table `jeux`.
-    - Utilise uniquement les colonnes données ci-dessus.
-    - Ne modifie pas la base de données.
-    - Pas de point-virgule final.
-    - Inclue un ORDER BY nom_du_jeu.
-    - Retourne toutes les colonnes avec SELECT *.
-    - Pour les filtres de texte, utilise toujours LIKE avec des % et des guillemets simples, jamais =.
-    - Pour les jeux en équipes, "OUI" et "AU CHOIX" sont acceptables si on veut inclure les jeux en équipes.
-    - Ne réponds pas avec du texte, uniquement la requête SQL.
-    """
+    return api_key
 
-    # 2. Add examples (few-shot prompting)
-    examples = """
-    Exemple 1 :
-    Question : "je veux tous les jeux coopératifs pour environ 2 joueurs"
-    Réponse :
-    SELECT *
-    FROM jeux
-    WHERE type_de_jeu LIKE '%Coopératif%'
-    AND joueurs_min <= 2
-    AND joueurs_max >= 2
-    ORDER BY nom_du_jeu
-
-    Exemple 2 :
-    Question : "jeux de culture générale de moins de 15 minutes"
-    Réponse :
-    SELECT *
-    FROM jeux
-    WHERE type_de_jeu LIKE '%Culture générale%'
-    AND (duree_min_minutes <= 15 OR duree_max_minutes <= 15)
-    ORDER BY nom_du_jeu
-
-    Exemple 3 :
-    Question : "nom = Citadelles"
-    Réponse :
-    SELECT *
-    FROM jeux
-    WHERE nom_du_jeu = 'Citadelles'
-    ORDER BY nom_du_jeu
-
-    Exemple 4 :
-    Question : "je veux les jeux pour exactement 4 joueurs et qui ne sont pas en équipes"
-    Réponse :
-    SELECT *
-    FROM jeux
-    WHERE joueurs_min = 4 AND joueurs_max = 4 AND en_equipe = 'NON'
-    ORDER BY nom_du_jeu
-    """
 
-    # 3. Final prompt with user's question
-    final_prompt = f"""{schema_description}
+def _get_client() -> "OpenAI":
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=_require_api_key(), http_client=_http_client())
+    return _client
+
+
+def _get_async_client() -> "AsyncOpenAI":
+    # For async servers: same settings, without blocking the event loop.
+    global _aclient
+    if _aclient is None:
+        _aclient = AsyncOpenAI(
+            api_key=_require_api_key(), http_client=_http_client(asynchronous=True)
+        )
+    return _aclient
+
+
+# The prompt is static apart from the question; build it once at import.
+_SCHEMA_DESCRIPTION = """Table SQLite `jeux`, colonnes :
+- nom_du_jeu TEXT
+- temps_de_jeu TEXT, ex "10 - 20 min" ; filtrer sur duree_min_minutes / duree_max_minutes (INTEGER, minutes)
+- nombre_de_joueurs TEXT, ex "2 à 4" ; filtrer sur joueurs_min / joueurs_max (INTEGER)
+- en_equipe TEXT : "OUI", "AU CHOIX" (équipes possibles) ou "NON"
+- support_particulier TEXT, ex "Cartes, Dés"
+- type_de_jeu TEXT, ex "Connaissances, Rapidité", "Compétitif"
+- tout_le_monde_peut_jouer TEXT : "oui", "non" ou un prérequis (ex "calculs", "Réflexion, culture précise")
+Règles :
+- Une seule requête SELECT * FROM jeux en lecture seule, colonnes ci-dessus uniquement.
+- Toujours ORDER BY nom_du_jeu, pas de point-virgule, aucun texte autour.
+- Filtres de texte : LIKE '%...%' (guillemets simples), jamais =.
+- Jeux en équipes : accepter "OUI" et "AU CHOIX".
+"""
+
+_EXAMPLES = """Exemples :
+"je veux tous les jeux coopératifs pour environ 2 joueurs" -> SELECT * FROM jeux WHERE type_de_jeu LIKE '%Coopératif%' AND joueurs_min <= 2 AND joueurs_max >= 2 ORDER BY nom_du_jeu
+"jeux de culture générale de moins de 15 minutes" -> SELECT * FROM jeux WHERE type_de_jeu LIKE '%Culture générale%' AND (duree_min_minutes <= 15 OR duree_max_minutes <= 15) ORDER BY nom_du_jeu
+"nom = Citadelles" -> SELECT * FROM jeux WHERE nom_du_jeu = 'Citadelles' ORDER BY nom_du_jeu
+"je veux les jeux pour exactement 4 joueurs et qui ne sont pas en équipes" -> SELECT * FROM jeux WHERE joueurs_min = 4 AND joueurs_max = 4 AND en_equipe = 'NON' ORDER BY nom_du_jeu
+"""
+
+_PROMPT_TEMPLATE = f"""{_SCHEMA_DESCRIPTION}{_EXAMPLES}
+Question : "{{question}}"
+SQL :"""
+
+_MAX_SQL_TOKENS = 256
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "Tu es un assistant qui génère du SQL SQLite."}
+
 
-    {examples}
+_BATCH_INSTRUCTIONS = """
+Une requête par question, dans l'ordre, chacune préfixée par "A<numéro>: " (ex "A1: SELECT ...").
+"""
+_BATCH_PROMPT_PREFIX = f"{_SCHEMA_DESCRIPTION}{_EXAMPLES}{_BATCH_INSTRUCTIONS}"
 
-    Maintenant, écris uniquement la requête SQL pour :
-    Question : "{question}"
-    Réponse :
+_BATCH_ANSWER_RE = re.compile(
+    r"^\s*A(\d+)\s*:\s*(.*?)(?=^\s*A\d+\s*:|\Z)", re.MULTILINE | re.DOTALL
+)
+
+
+def generate_sql_from_question(question: str) -> str:
+    _get_client()  # raises before touching the cache if OpenAI is not configured
+    # Repeated questions are answered from the cache. Only whitespace is
+    # normalized: case matters for the literals the model copies into the SQL.
+    return _generate_sql(" ".join(question.split()))
+
+
+def _completion_request(question: str) -> dict:
+    # Streamed, so an answer that is bound to fail is_sql_safe can be cut
+    # short instead of waiting for the whole completion.
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": _PROMPT_TEMPLATE.format(question=question)},
+        ],
+        "temperature": 0,
+        # A single SELECT fits well within 256 tokens; stop decoding at the
+        # first blank line or statement terminator instead of running on.
+        "max_tokens": _MAX_SQL_TOKENS,
+        "stop": ["\n\n", ";"],
+        "response_format": {"type": "text"},
+        "stream": True,
+    }
+
+
+def _append_chunk(sql: str, chunk) -> tuple[str, bool]:
+    """Add a streamed chunk to ``sql``; the flag says whether to stop reading."""
+    if not chunk.choices:
+        return sql, False
+    start = max(0, len(sql) - 7)  # rescan a keyword split across chunks
+    sql += chunk.choices[0].delta.content or ""
+    forbidden = _FORBIDDEN_RE.search(sql, start)
+    # A keyword touching the end may still grow into another word.
+    stop = bool(forbidden) and (forbidden.group(0) == ";" or forbidden.end() < len(sql))
+    return sql, stop
+
+
+@lru_cache(maxsize=1024)
+def _generate_sql(question: str) -> str:
+    stream = _get_client().chat.completions.create(**_completion_request(question))
+    sql = ""
+    try:
+        for chunk in stream:
+            sql, stop = _append_chunk(sql, chunk)
+            if stop:
+                break
+    finally:
+        stream.close()
+    return sql.strip()
+
+
+async def generate_sql_from_question_async(question: str) -> str:
+    """Async counterpart of generate_sql_from_question, on an AsyncOpenAI client.
+
+    Answers are not shared with the synchronous cache.
+    """
+    aclient = _get_async_client()
+    question = " ".join(question.split())
+    stream = await aclient.chat.completions.create(**_completion_request(question))
+    sql = ""
+    try:
+        async for chunk in stream:
+            sql, stop = _append_chunk(sql, chunk)
+            if stop:
+                break
+    finally:
+        await stream.close()
+    return sql.strip()
+
+
+def generate_sql_from_questions(questions: list[str]) -> list[Optional[str]]:
+    """Generate one SQL query per question with a single OpenAI call.
+
+    Each answer is checked with is_sql_safe; rejected answers come back as
+    None so one bad query does not discard the rest of the batch.
     """
+    client = _get_client()
+    if not questions:
+        return []
 
-    # Call OpenAI
+    numbered = "\n".join(
+        f'Q{number} : "{" ".join(question.split())}"'
+        for number, question in enumerate(questions, start=1)
+    )
     completion = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
-            {"role": "system", "content": "Tu es un assistant qui génère du SQL SQLite."},
-            {"role": "user", "content": final_prompt},
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": f"{_BATCH_PROMPT_PREFIX}{numbered}\n"},
         ],
         temperature=0,
+        # No stop sequences here: answers are separated by newlines.
+        max_tokens=_MAX_SQL_TOKENS * len(questions),
+        response_format={"type": "text"},
     )
 
-    sql = completion.choices[0].message.content.strip()
-    return sql
+    content = completion.choices[0].message.content
+    answers = {
+        int(number): sql.strip()
+        for number, sql in _BATCH_ANSWER_RE.findall(content)
+    }
+    missing = [n for n in range(1, len(questions) + 1) if not answers.get(n)]
+    if missing:
+        raise RuntimeError(f"Réponse incomplète du modèle : pas de requête pour Q{missing[0]}.")
+    return [
+        answers[n] if is_sql_safe(answers[n]) else None
+        for n in range(1, len(questions) + 1)
+    ]
+
 
-ALLOWED_COLUMNS = {
+ALLOWED_COLUMNS = frozenset({
     "nom_du_jeu",
     "temps_de_jeu",
     "duree_min_minutes",
@@ -135,80 +253,89 @@ ALLOWED_COLUMNS = {
     "support_particulier",
     "type_de_jeu",
     "tout_le_monde_peut_jouer",
-}
+})
 
-SQL_KEYWORDS = {
+SQL_KEYWORDS = frozenset({
     "select", "from", "where", "and", "or", "order", "by",
     "asc", "desc", "like", "in", "between", "is", "null",
     "not", "group", "having", "limit", "case", "when",
     "then", "end", "else", "as", "distinct", "on", "inner",
     "left", "right", "join", "outer"
-}
-
-FORBIDDEN_PATTERNS = [
-    r"\binsert\b",
-    r"\bupdate\b",
-    r"\bdelete\b",
-    r"\bdrop\b",
-    r"\balter\b",
-    r"\bcreate\b",
-    r";",  # no statement chaining
-]
+})
+
+# Lowercased tokens that need no further check: keywords and the table name.
+_SKIP = SQL_KEYWORDS | frozenset({"jeux"})
+
+MAX_SQL_LENGTH = 4096
+
+# Compiled once at import; is_sql_safe runs on every generated query.
+# Write/DDL keywords, plus ";" so statements cannot be chained.
+# re.ASCII: SQLite keywords, whitespace and word boundaries are ASCII-only, so
+# Unicode case folding and character classes would be wasted work.
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:insert|update|delete|drop|alter|create)\b|;", re.IGNORECASE | re.ASCII
+)
+# SELECT first, reading FROM jeux (we'll accept aliases later if needed,
+# but for now we keep it strict).
+_SHAPE_RE = re.compile(
+    r"\A\s*select\b.*?\bfrom\s+jeux\b", re.IGNORECASE | re.DOTALL | re.ASCII
+)
+_STRING_LITERAL_RE = re.compile(r"'[^']*'", re.ASCII)
+# Every ASCII character that cannot appear in an identifier becomes a space,
+# so identifiers come out of a translate + split.
+_IDENT_TRANS = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
 
 
 def is_sql_safe(sql: str) -> bool:
     if not isinstance(sql, str):
-        print("SQL is not a string")
+        _log.debug("SQL rejected: not a string")
         return False
-
-    # 1. Basic shape checks
-    lowered = sql.strip().lower()
-
-    # must start with SELECT
-    if not lowered.startswith("select"):
-        print("SQL does not start with SELECT")
+    # No generated query comes close; bounds the cost of the regex passes
+    # and keeps oversized strings out of the cache.
+    if len(sql) > MAX_SQL_LENGTH:
+        _log.debug("SQL rejected: longer than %d characters", MAX_SQL_LENGTH)
         return False
+    return _is_sql_safe(sql)
+
 
-    # must read FROM jeux (we'll accept aliases later if needed,
-    # but for now we keep it strict)
-    if "from jeux" not in lowered:
-        print("SQL does not read FROM jeux")
+# The checks are pure over the string, and cached LLM answers come back as
+# the same string; rejections are therefore logged once per distinct SQL.
+@lru_cache(maxsize=512)
+def _is_sql_safe(sql: str) -> bool:
+    # 1. Basic shape checks, case-insensitive without lowercasing a copy:
+    #    must be a SELECT that reads FROM jeux
+    if not _SHAPE_RE.match(sql):
+        _log.debug("SQL rejected: not a SELECT reading FROM jeux")
         return False
 
     # forbid dangerous stuff
-    for pat in FORBIDDEN_PATTERNS:
-        if re.search(pat, lowered):
-            print(f"Forbidden pattern found: {pat}")
-            return False
+    forbidden = _FORBIDDEN_RE.search(sql)
+    if forbidden:
+        _log.debug("SQL rejected: forbidden pattern %r", forbidden.group(0))
+        return False
 
     # 2. Remove all single-quoted strings so we don't accidentally think
     #    'Citadelles' is an identifier.
     #    This regex removes 'anything inside quotes', including accents/spaces.
-    sql_no_strings = re.sub(r"'[^']*'", "''", sql)
+    sql_no_strings = _STRING_LITERAL_RE.sub("''", sql)
 
     # 3. Extract candidate identifiers
-    #    We'll grab all tokens that look like barewords: letters/underscores/digits
-    #    (this will catch column names, table names, keywords, etc.)
-    candidates = set(re.findall(r"[a-zA-Z_][a-zA-Z0-9_]*", sql_no_strings))
-
-    # 4. Filter out known SQL keywords and numbers and the table name itself
-    cleaned = {
-        ident
-        for ident in candidates
-        if ident.lower() not in SQL_KEYWORDS
-        and ident.lower() != "jeux"
-        and not ident.isdigit()
-    }
-
-    # 5. Now, any remaining identifiers MUST either:
-    #    - be "*"  (select *)
-    #    - or be one of our allowed columns.
-    # Note: "*" won't be captured by the regex above, so we don't need to handle it here.
-
-    for ident in cleaned:
-        # example: ORDER, BY etc are filtered already; now we check columns
-        if ident not in ALLOWED_COLUMNS:
-            print(f"Unsafe identifier found: {ident}")
+    #    We'll grab all barewords: letters/underscores/digits
+    #    (this will catch column names, table names, keywords, numbers, etc.)
+    candidates = set(sql_no_strings.translate(_IDENT_TRANS).split())
+
+    # 4. Skip known SQL keywords, numbers and the table name itself; any
+    #    remaining identifier MUST be one of our allowed columns.
+    # Note: "*" is turned into a space above, so we don't need to handle it here.
+    # SQLite identifiers are case-insensitive, so compare them lowercased.
+    for ident in candidates:
+        lowered = ident.lower()
+        if lowered in _SKIP or ident.isdigit():
+            continue
+        if lowered not in ALLOWED_COLUMNS:
+            _log.debug("SQL rejected: unsafe identifier %r", ident)
             return False
 
     return True